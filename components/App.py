@@ -1,4 +1,37 @@
-import asyncio
+import asyncio, sys
+
+# The firmware target keeps MicroPython's native loop, CPython (server/simulator) targets use uvloop if installed
+if sys.implementation.name != "micropython":
+    try:
+        import uvloop  # type: ignore (optional dependency)
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+# Cache of (module_path, class_name) -> class, filled by _cached_import
+_import_cache = {}
+
+
+def _cached_import(module_path: str, class_name: str):
+    """
+    Import a class from a module, consulting sys.modules before the import machinery.
+
+    :param module_path: The path to the module to import.
+    :param class_name: The name of the class to get from the module.
+
+    :return: The class.
+    """
+    key = (module_path, class_name)
+    cls = _import_cache.get(key)
+    if cls is None:
+        module = sys.modules.get(module_path)
+        if module is None:
+            # importlib is not available on MicroPython, use __import__ on a miss
+            module = __import__(module_path, None, None, [class_name])
+        cls = getattr(module, class_name)
+        _import_cache[key] = cls
+    return cls
 
 
 class BaseApp:
@@ -13,8 +46,8 @@ class BaseApp:
     def __init__(
         self,
         app_name: str = "BaseApp",
-        drivers: list = [],
-        modules: list = [],
+        drivers: list = None,
+        modules: list = None,
     ):
         """
         Initialize the app.
@@ -28,13 +61,18 @@ class BaseApp:
         # Initialize app name
         self._app_name = app_name
 
+        # Set by stop() to end the main loop
+        self._shutdown = asyncio.Event()
+
     def __repr__(self) -> str:
         return self._app_name
 
     def __str__(self) -> str:
         return self._app_name
 
-    def load_module(self, module_path, module_name, module_args=[], module_kwargs={}):
+    def load_module(
+        self, module_path, module_name, module_args=None, module_kwargs=None
+    ):
         """
         Import and load a module.
 
@@ -51,26 +89,32 @@ class BaseApp:
         """
 
         # Import module
-        module_module = __import__(module_path, None, None, [module_name])
-        module_class = getattr(module_module, module_name)
+        module_class = _cached_import(module_path, module_name)
 
         # Initialize module
-        module_instance = module_class(self, *module_args, **module_kwargs)
+        module_instance = module_class(
+            self, *(module_args or ()), **(module_kwargs or {})
+        )
 
         # Store module instance
         setattr(self, module_name, module_instance)
 
+    def stop(self):
+        """
+        Stop the main loop.
+        """
+        self._shutdown.set()
+
     async def _loop(self, infinite: bool = True):
         """
         Main loop.
 
-        :param infinite: Whether or not to run the loop infinitely.
+        :param infinite: Whether or not to run the loop until stop() is called.
         """
 
-        # Run the loop infinitely
+        # Park until the app is stopped
         if infinite:
-            while True:
-                await asyncio.sleep(0)
+            await self._shutdown.wait()
 
         # Run the loop once
         else:
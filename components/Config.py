@@ -3,13 +3,20 @@ import json
 
 
 class Config:
+    # Parsed config and root node per filename, shared by every Config() so each file is parsed once per boot
+    _cache = {}
+
     def __init__(self, file="/config.json"):
         self._filename = file
 
-        with open(self._filename, "r") as f:
-            self._config = json.loads(f.read())
+        cached = Config._cache.get(file)
+        if cached is None:
+            with open(self._filename, "r") as f:
+                config = json.loads(f.read())
+
+            cached = Config._cache[file] = (config, Config.ConfigNode(config))
 
-        self._config_obj = Config.ConfigNode(self._config)
+        self._config, self._config_obj = cached
 
     @property
     def get(self):
@@ -17,12 +24,20 @@ class Config:
 
     class ConfigNode:
         def __init__(self, config):
-            for k, v in config.items():
-                if isinstance(k, (list, tuple)):
-                    setattr(
-                        self,
-                        k,
-                        [Config.ConfigNode(x) if isinstance(x, dict) else x for x in v],
-                    )
-                else:
-                    setattr(self, k, Config.ConfigNode(v) if isinstance(v, dict) else v)
+            # Children are materialized on first access in __getattr__
+            self._raw = config
+
+        def __getattr__(self, name):
+            # Only called when name is not already cached as an attribute
+            try:
+                v = self._raw[name]
+            except KeyError:
+                raise AttributeError(name)
+
+            if isinstance(v, dict):
+                v = Config.ConfigNode(v)
+            elif isinstance(v, (list, tuple)):
+                v = [Config.ConfigNode(x) if isinstance(x, dict) else x for x in v]
+
+            setattr(self, name, v)
+            return v
@@ -1,5 +1,7 @@
 import asyncio
 
+from utilities import type_coro as tc
+
 
 class EventStore:
     """
@@ -10,9 +12,9 @@ class EventStore:
 
     def __init__(self):
         """
-        Initialize the eventstore dictionary
+        Initialize the eventstore dictionary, keyed by (module, name)
         """
-        self._eventstore = {}
+        self._events = {}
         self._app = None
 
     @property
@@ -33,6 +35,16 @@ class EventStore:
         """
         self._app = app
 
+    def _key(self, module: str | object, name: str) -> tuple:
+        """
+        Build the eventstore key for an event.
+
+        :param module: The module (or module name) that owns the event.
+        :param name: The name of the event.
+        :return: A (module name, event name) tuple.
+        """
+        return (module if type(module) is str else module.__name__, name)
+
     def create_event(self, module: str | object, name: str) -> bool:
         """
         Create an event and store it in the eventstore along with a list of tasks subscribed to it.
@@ -40,21 +52,13 @@ class EventStore:
         :param name: The name of the event.
         :return: True if the event was created, False otherwise.
         """
-        module = module if isinstance(module, str) else module.__name__
-
-        try:
-            if module not in self._eventstore:
-                self._eventstore[module] = {}
-
-            if name in self._eventstore[module]:
-                return False
-
-            self._eventstore[module][name] = (asyncio.Event(), [])
-            return True
-
-        except Exception as e:
+        key = self._key(module, name)
+        if key in self._events:
             return False
 
+        self._events[key] = (asyncio.Event(), [])
+        return True
+
     def retrieve_event(self, module: str | object, name: str) -> asyncio.Event:
         """
         Retrieve an event from the eventstore.
@@ -62,41 +66,26 @@ class EventStore:
         :param name: The name of the event to retrieve.
         :return: The event if it exists, None otherwise.
         """
-        module = module if isinstance(module, str) else module.__name__
-
-        try:
-            return self._eventstore[module][name][0]
-        except:
-            return None
+        entry = self._events.get(self._key(module, name))
+        return entry[0] if entry is not None else None
 
     def retrieve_all_module_events(self, module: str | object) -> list:
         """
         Retrieve all of a module's events from the eventstore.
 
         :param module: The module to retrieve events for.
-        :return: A list of all events in the eventstore.
+        :return: A list of all event names in the eventstore for the module.
         """
-        module = module if isinstance(module, str) else module.__name__
-
-        try:
-            return self._eventstore[module].keys()
-        except:
-            return None
+        module = self._key(module, None)[0]
+        return [n for (m, n) in self._events if m == module]
 
     def retrieve_all_events(self) -> list:
         """
         Retrieve all events from the eventstore.
 
-        :return: A list of all events in the eventstore.
+        :return: A list of all (module, name) event keys in the eventstore.
         """
-        l = []
-        try:
-            for module in self._eventstore:
-                for event_tuple in self._eventstore[module]:
-                    l.apppend(event_tuple)
-            return l
-        except:
-            return None
+        return list(self._events)
 
     def set_event(self, module: str | object, name: str) -> bool:
         """
@@ -105,14 +94,13 @@ class EventStore:
         :param name: The name of the event to set.
         :return: True if the event was set, False otherwise.
         """
-        module = module if isinstance(module, str) else module.__name__
-
-        try:
-            self._eventstore[name][0].set()
-            return True
-        except:
+        entry = self._events.get(self._key(module, name))
+        if entry is None:
             return False
 
+        entry[0].set()
+        return True
+
     def clear_event(self, module: str | object, name: str) -> bool:
         """
         Clear an event.
@@ -120,14 +108,13 @@ class EventStore:
         :param name: The name of the event to clear.
         :return True if the event was cleared, False otherwise.
         """
-        module = module if isinstance(module, str) else module.__name__
-
-        try:
-            self._eventstore[module][name][0].clear()
-            return True
-        except:
+        entry = self._events.get(self._key(module, name))
+        if entry is None:
             return False
 
+        entry[0].clear()
+        return True
+
     def delete_event(self, module: str | object, name: str) -> bool:
         """
         Delete an event.
@@ -135,14 +122,13 @@ class EventStore:
         :param name: The name of the event to delete.
         :return: True if the event was deleted, False otherwise.
         """
-        module = module if isinstance(module, str) else module.__name__
-
-        try:
-            del self._eventstore[module][name]
-            return True
-        except:
+        key = self._key(module, name)
+        if key not in self._events:
             return False
 
+        del self._events[key]
+        return True
+
     def subscribe_task(
         self, module: str | object, name: str, task: asyncio.Task
     ) -> bool:
@@ -153,14 +139,13 @@ class EventStore:
         :param task: The task to subscribe.
         :return: True if the task was subscribed, False otherwise.
         """
-        module = module if isinstance(module, str) else module.__name__
-
-        try:
-            self._eventstore[module][name][1].append(task)
-            return True
-        except:
+        entry = self._events.get(self._key(module, name))
+        if entry is None:
             return False
 
+        entry[1].append(task)
+        return True
+
     def unsubscribe_task(
         self, module: str | object, name: str, task: asyncio.Task
     ) -> bool:
@@ -171,32 +156,31 @@ class EventStore:
         :param task: The task to unsubscribe.
         :return: True if the task was unsubscribed, False otherwise.
         """
-        module = module if isinstance(module, str) else module.__name__
-
-        try:
-            self._eventstore[module][name][1].remove(task)
-            return True
-        except:
+        entry = self._events.get(self._key(module, name))
+        if entry is None or task not in entry[1]:
             return False
 
-    def execute_subscribers(self, event: asyncio.Event) -> bool:
+        entry[1].remove(task)
+        return True
+
+    def execute_subscribers(self, module: str | object, name: str) -> bool:
         """
         Execute all subscribers of an event.
+        Plain callables are called directly. Coroutines are scheduled through the app's TaskStore
+        under the event's module as "<name>[<subscriber index>]", replacing a previous run.
 
-        :param event: The event to execute subscribers for.
-        :return: True if the subscribers were executed, False otherwise.
+        :param name: The name of the event to execute subscribers for.
+        :return: True if the subscribers were executed, False if the event does not exist.
         """
+        key = self._key(module, name)
+        entry = self._events.get(key)
+        if entry is None:
+            return False
 
-        async def _async():
-            pass
-
-        try:
-            for task in self._eventstore[event][1]:
-                if isinstance(task(), _async()):
-                    self.app.taskstore.create_task(task)
-                else:
-                    task()
-            return True
-        except Exception as e:
-            raise e
-            # return False
+        for i, task in enumerate(entry[1]):
+            res = task()
+            if isinstance(res, tc):
+                self.app.TaskStore.create_task(
+                    res, f"{name}[{i}]", module=key[0], recreate=True
+                )
+        return True
@@ -1,5 +1,7 @@
 import asyncio
 
+from utilities import type_coro as tc
+
 
 class TaskStore:
     """
@@ -34,7 +36,7 @@ class TaskStore:
         """
         Schedule a coroutine to be executed and store a reference to it in the taskstore.
 
-        :param coro: The coroutine to create.
+        :param coro: The coroutine function to create, or an already created coroutine (coro_args/coro_kwargs are then ignored).
         :param name: The name of the task to create.
         :param recreate: Whether or not to recreate the task if it already exists.
 
@@ -46,22 +48,24 @@ class TaskStore:
 
         name = name if name != None else coro.__name__
 
-        if module != None:
-            if module not in self._taskstore:
-                self._taskstore[module] = {}
-
-        ts = self._taskstore[module] if module != None else self._taskstore
+        ts = (
+            self._taskstore.setdefault(module, {})
+            if module != None
+            else self._taskstore
+        )
 
         try:
-            if name in ts:
-                if recreate:
-                    ts[name].cancel()
-                else:
+            existing = ts.get(name)
+            if existing is not None:
+                if not recreate:
                     return RuntimeWarning(
                         "Task " + name + " already exists, recreate was not set"
                     )
+                existing.cancel()
 
-            ts[name] = asyncio.create_task(coro(*coro_args, **coro_kwargs))
+            if not isinstance(coro, tc):
+                coro = coro(*(coro_args or ()), **(coro_kwargs or {}))
+            ts[name] = asyncio.create_task(coro)
 
             return True
 
@@ -77,32 +81,34 @@ class TaskStore:
         :param moduke: Optional module name to retrieve task from.
         :return: The task if it exists, None otherwise.
         """
-        try:
-            return (
-                self._taskstore[name]
-                if module == None
-                else self._taskstore[module][name]
-            )
-        except:
-            return None
+        ts = self._taskstore if module == None else self._taskstore.get(module)
+        return ts.get(name) if ts is not None else None
+
+    def _leaves(self) -> list:
+        """
+        Walk the taskstore iteratively, descending into module dictionaries.
+
+        :return: A list of (containing dict, task name, task) tuples for every task in the taskstore.
+        """
+        out = []
+        stack = [self._taskstore]
+        while stack:
+            d = stack.pop()
+            for k, v in d.items():
+                if isinstance(v, dict):
+                    stack.append(v)
+                else:
+                    out.append((d, k, v))
+        return out
 
     def retrieve_all_tasks(self) -> list or None:
         """
         Retrieve all tasks from the taskstore.
-        If the value of an item is a dictionary, then recurse into that dictionary to return its tasks.
+        If the value of an item is a dictionary, then its tasks are included as well.
 
         :return: A list of all task names in the taskstore.
         """
-        try:
-            l = []
-            for task in self._taskstore:
-                if isinstance(self._taskstore[task], dict):
-                    l += self.retrieve_all_tasks(self._taskstore[task])
-                else:
-                    l.append(task)
-            return l
-        except:
-            return None
+        return [name for _, name, _ in self._leaves()]
 
     def retrieve_all_module_tasks(self, module: str) -> list or None:
         """
@@ -110,10 +116,8 @@ class TaskStore:
 
         :return: A list of all task names in the taskstore for a given module.
         """
-        try:
-            return self._taskstore[module].keys()
-        except:
-            return None
+        ts = self._taskstore.get(module)
+        return ts.keys() if ts is not None else None
 
     def cancel_task(self, name: str, module: str = None) -> bool:
         """
@@ -123,30 +127,23 @@ class TaskStore:
         :param moduke: Optional module name to cancel task from.
         :return: True if the task was cancelled, False otherwise.
         """
-        try:
-            self._taskstore[name].cancel() if module == None else self._taskstore[
-                module
-            ][name].cancel()
-            return True
-        except:
+        task = self.retrieve_task(name, module)
+        if task is None:
             return False
 
+        task.cancel()
+        return True
+
     def cancel_all_tasks(self) -> bool:
         """
         Cancel all tasks.
-        If the value of an item is a dictionary, then recurse into that dictionary to cancel its tasks.
+        If the value of an item is a dictionary, then its tasks are cancelled as well.
 
         :return: True if the tasks were cancelled, False otherwise.
         """
-        try:
-            for task in self._taskstore:
-                if isinstance(self._taskstore[task], dict):
-                    self.cancel_all_tasks(self._taskstore[task])
-                else:
-                    self._taskstore[task].cancel()
-            return True
-        except:
-            return False
+        for _, _, task in self._leaves():
+            task.cancel()
+        return True
 
     def delete_task(self, name: str, module: str = None) -> bool:
         """
@@ -156,28 +153,23 @@ class TaskStore:
         :param moduke: Optional module name to delete task from.
         :return: True if the task was deleted, False otherwise.
         """
-        try:
-            self.cancel_task(name, module)
-            ts = self._taskstore[module] if module != None else self._taskstore
-            del ts[name]
-            return True
-        except:
+        ts = self._taskstore if module == None else self._taskstore.get(module)
+        if ts is None or name not in ts:
             return False
 
+        ts[name].cancel()
+        del ts[name]
+        return True
+
     def delete_all_tasks(self) -> bool:
         """
         Delete all tasks. Will cancel the tasks if they are running.
-        If the value of an item is a dictionary, then recurse into that dictionary to delete its tasks.
+        If the value of an item is a dictionary, then its tasks are deleted as well.
 
         :return: True if the tasks were deleted, False otherwise.
         """
-        try:
-            for task in self._taskstore:
-                if isinstance(self._taskstore[task], dict):
-                    self.delete_all_tasks(self._taskstore[task])
-                else:
-                    self.cancel_task(task)
-                    del self._taskstore[task]
-            return True
-        except:
-            return False
+        # Collect the leaves first so no dictionary changes size while it is being iterated
+        for d, name, task in self._leaves():
+            task.cancel()
+            del d[name]
+        return True
@@ -3,31 +3,29 @@ import asyncio, machine
 
 class Relay:
     def __init__(self, pin: machine.Pin or tuple or list):
-        self._pin = pin
-        self._state = self._get_pin(pin)
-
-    def _get_pin(self, pin) -> bool:
-        if isinstance(pin, tuple) or isinstance(pin, list):
-            return all([self._get_pin(p) for p in pin])
+        # The pin shape never changes, so pick the read/write implementation once
+        if isinstance(pin, (tuple, list)):
+            pins = tuple(pin)
+            self._read_impl = lambda: all([bool(p.value()) for p in pins])
+            self._write_impl = lambda state: [p.value(state) for p in pins]
         else:
-            return bool(pin.value())
+            self._read_impl = lambda: bool(pin.value())
+            self._write_impl = pin.value
+
+        self._state = self._read_impl()
 
-    def _set_pin(self, pin, state):
+    def _set_state(self, state):
         self._state = bool(state)
-        if isinstance(pin, tuple) or isinstance(pin, list):
-            for p in pin:
-                self._set_pin(p, state)
-        else:
-            pin.value(state)
+        self._write_impl(state)
 
     def on(self):
-        self._set_pin(self._pin, True)
+        self._set_state(True)
 
     def off(self):
-        self._set_pin(self._pin, False)
+        self._set_state(False)
 
     def toggle(self):
-        self._set_pin(self._pin, not self._state)
+        self._set_state(not self._state)
 
     @property
     def state(self) -> bool:
@@ -35,4 +33,4 @@ class Relay:
 
     @state.setter
     def state(self, state: bool):
-        self._set_pin(self._pin, state)
+        self._set_state(state)
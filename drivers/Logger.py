@@ -4,12 +4,17 @@ Author: jmyers
 File: logger.py
 
 """
+import sys
+
 from components.Config import Config
 from drivers.Time import Time
 
 Config = Config().get.log
 time = Time()
 
+# Bound once so each log line skips the global + attribute lookup
+_localtime = time.localtime
+
 # Log levels (enumerated)
 Levels = {
     "DEBUG": 0,
@@ -40,6 +45,26 @@ class bcolors:
     CRITICAL = CRITICAL
 
 
+def _use_color() -> bool:
+    """
+    Whether log lines should include ANSI color codes.
+    The log.color config flag takes precedence, otherwise color is used if stdout is a TTY.
+    MicroPython's stdout has no isatty(), so color is kept there unless disabled in config.
+    """
+    if hasattr(Config, "color"):
+        return bool(Config.color)
+
+    isatty = getattr(sys.stdout, "isatty", None)
+    return isatty() if isatty is not None else True
+
+
+# Strip the color codes once so the per-level templates are built as plain text
+if not _use_color():
+    for _name in dir(bcolors):
+        if _name.isupper():
+            setattr(bcolors, _name, "")
+
+
 class Logger:
     # Initialize
     def __init__(
@@ -51,13 +76,26 @@ class Logger:
         self._conf_level = conf_level.upper()
         self._conf_level_int = Levels[self._conf_level]
 
-        # Dynamically create log level functions
-        for lvl, rank in Levels.items():
-            setattr(
-                self,
-                lvl.lower(),
-                lambda message, lvl=lvl: self._log(self._module, message, lvl),
+        # Precompute the colored prefix/suffix around the timestamp and message for each level
+        self._templates = {
+            lvl: (
+                f"{bcolors.BOLD}[",
+                f"][{module_name}] {getattr(bcolors, lvl)}{lvl}:{bcolors.ENDC} {getattr(bcolors, lvl)}",
+                bcolors.ENDC,
             )
+            for lvl in Levels
+        }
+
+        # Dynamically create log level functions (no-ops for levels below the configured level)
+        self._emitters = {}
+        for lvl, rank in Levels.items():
+            if rank < self._conf_level_int:
+                emit = lambda message, *args: None
+            else:
+                emit = self._make_emitter(*self._templates[lvl])
+
+            self._emitters[lvl] = emit
+            setattr(self, lvl.lower(), emit)
 
     @property
     def configured_level(self):
@@ -66,35 +104,35 @@ class Logger:
         """
         return self._conf_level
 
-    # Log a message with a timestamp, the module, the level, and the message
-    def _log(self, module, message, level: str):
-        # Retrun without printing if the level is not valid
-        if level not in Levels:
-            return
-
-        # Get the rank of the level and return without printing if it is below the configured level
-        rank = Levels[level]
-        if rank < self._conf_level_int:
-            return
-
-        try:
-            print(
-                f"{bcolors.BOLD}[{time.localtime().to_string()}]"
-                + f"[{str(module)}] "
-                + f"{getattr(bcolors, level.upper())}{str(level)}:{bcolors.ENDC} "
-                + f"{getattr(bcolors, level.upper())}{message}{bcolors.ENDC}"
-            )
-        except Exception as e:
-            print(
-                f"{bcolors.CRITICAL}[{time.localtime().to_string()}][LOGGER] ERROR: Failed to print message, error: {str(e)}{bcolors.ENDC}"
-            )
+    @staticmethod
+    def _make_emitter(p1, p2, p3):
+        """
+        Build a function that prints a message with a timestamp between the given template parts.
+        If args are given, the message is %-formatted with them (only when the level is enabled).
+        """
+
+        def emit(message, *args):
+            try:
+                if args:
+                    message = message % args
+                print(p1, _localtime().to_string(), p2, message, p3, sep="")
+            except Exception as e:
+                print(
+                    f"{bcolors.CRITICAL}[{_localtime().to_string()}][LOGGER] ERROR: Failed to print message, error: {str(e)}{bcolors.ENDC}"
+                )
+
+        return emit
 
-    def log(self, message, level: str = None):
+    def log(self, message, level: str = None, *args):
         """
         Generic log function. Must be called with a valid level.
 
-        :param message: The message to log.
+        :param message: The message to log, or a %-format string if args are given.
         :param level: The level of the message. Must be one of the following:
             DEBUG, INFO, WARN, ERROR, CRITICAL
+        :param args: Optional arguments to %-format the message with.
         """
-        self._log(self._module, message, level)
+        # Unknown levels are ignored, suppressed levels dispatch to a no-op emitter
+        emit = self._emitters.get(level)
+        if emit is not None:
+            emit(message, *args)
@@ -40,6 +40,9 @@ class NTPTime:
         self._max_retries = ntp_max_retries
         self._status_code = 0
 
+        # Set once the first sync attempt has finished (synced or retries exhausted)
+        self.ready_event = asyncio.Event()
+
         # After init, call self.run()
         self._watchdog = asyncio.create_task(self._run())
 
@@ -63,17 +66,9 @@ class NTPTime:
 
     async def _run(self) -> None:
         while True:
-            # If time has not been synced, or it has been more than _sync_interval seconds since last sync, sync time
-            if not self._initial_sync or T.ticks_diff(T.ticks_ms(), self._last_sync) > (
-                self._sync_interval * 1000
-            ):
-                Logger.debug(
-                    f"Last sync was {T.ticks_diff(T.ticks_ms(), self._last_sync) / 1000:.0f}s ago"
-                )
-                await self.sync_time()
-
-            # Yield to other tasks
-            await asyncio.sleep_ms(100)
+            # Sync time (sync_time handles its own retries), then sleep until the next sync is due
+            await self.sync_time()
+            await asyncio.sleep(self._sync_interval)
 
     def _cancel_watchdog(self) -> None:
         """
@@ -98,6 +93,7 @@ class NTPTime:
 
             self._last_sync = T.ticks_ms()
             self._status_code = 1
+            self.ready_event.set()
 
             # Create a time object representing a future time when we will sync again
             next_sync = (
@@ -122,5 +118,6 @@ class NTPTime:
                 )
                 self._last_sync = T.ticks_ms()
                 self._status_code = 2
+                self.ready_event.set()
 
                 return False
@@ -21,10 +21,10 @@ Logger = Logger(module_name="StatusLED")
 
 # Define the effect that corresponds to each status code
 StatusCodes = {
-    "0": ["off", [], {}],
-    "1": ["blink", [2, 300, 200, 1000], {"loop": True}],
-    "2": ["breathe", [], {"steps": 4}],
-    "3": ["blink", [3, 300, 200, 500], {"loop": True}],
+    0: ["off", [], {}],
+    1: ["blink", [2, 300, 200, 1000], {"loop": True}],
+    2: ["breathe", [], {"steps": 4}],
+    3: ["blink", [3, 300, 200, 500], {"loop": True}],
 }
 
 
@@ -65,23 +65,26 @@ class StatusLED(BaseDriver):
 
     async def _check_status_code(self):
         Logger.debug("Starting status code watchdog")
+
+        # Bind lookups used on every iteration
+        ctx = self._context
+        changed = ctx.status_changed
+        codes = StatusCodes
+        prev = self._status_code
+
         while True:
-            # Get the current status code from the app context
-            status_code = self._context.status_code
+            # Wait for the app context to report a status code change
+            await changed.wait()
+            changed.clear()
 
             # If the status code has changed, update the LED
-            if self._status_code != status_code:
+            status_code = ctx.status_code
+            if status_code != prev:
                 Logger.debug("Status code changed to " + str(status_code))
-                self._status_code = status_code
-
-                self.set(
-                    StatusCodes[str(status_code)][0],
-                    args=StatusCodes[str(status_code)][1],
-                    kwargs=StatusCodes[str(status_code)][2],
-                )
+                prev = self._status_code = status_code
 
-            # Sleep for 100ms
-            await asyncio.sleep_ms(100)
+                effect, args, kwargs = codes[status_code]
+                self.set(effect, args=args, kwargs=kwargs)
 
     def deinit(self):
         self._run.cancel()
@@ -104,9 +107,7 @@ class StatusLED(BaseDriver):
         # If the requested effect is async, create a task
         func = getattr(self, effect)(*args, **kwargs)
         if isinstance(func, tc):
-            self._current_task = asyncio.create_task(
-                getattr(self, effect)(*args, **kwargs)
-            )
+            self._current_task = asyncio.create_task(func)
 
     async def breathe(self, steps=None):
         """
@@ -13,25 +13,28 @@ class Time:
         self.time = time
         self.Config = Config().get
 
+        # Seconds since the epoch for self.time, when known (saves a mktime round-trip)
+        self._epoch = None
+
+        # The configured offset is fixed at runtime, so convert it to seconds once
+        self._offset = self.Config.time_offset * 3600
+
     def gmtime(self):
-        self.time = T.gmtime()
+        self._epoch = T.time()
+        self.time = T.gmtime(self._epoch)
         return self
 
     def localtime(self):
-        self.time = T.localtime(T.time() + (self.Config.time_offset * 3600))
+        self._epoch = T.time() + self._offset
+        self.time = T.localtime(self._epoch)
         return self
 
     def offset_seconds_time(self, offset_seconds):
-        self.time = T.localtime(T.mktime(self.time) + offset_seconds)
+        epoch = self._epoch if self._epoch is not None else T.mktime(self.time)
+        self._epoch = epoch + offset_seconds
+        self.time = T.localtime(self._epoch)
         return self
 
     def to_string(self):
-        tformat = "{:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}"
-        return tformat.format(
-            self.time[0],
-            self.time[1],
-            self.time[2],
-            self.time[3],
-            self.time[4],
-            self.time[5],
-        )
+        t = self.time
+        return f"{t[0]:04d}-{t[1]:02d}-{t[2]:02d}T{t[3]:02d}:{t[4]:02d}:{t[5]:02d}"
@@ -1,59 +1,92 @@
-import asyncio, network, time
+import asyncio, micropython, random  # type: ignore (assume imports are available in micropython)
 from components.Config import Config
-from drivers.Logger import Logger
+from drivers.Logger import Logger  # Reads the log config section at import
 
-Config = Config().get.network
 Logger = Logger(module_name="WLAN")
 
-SecurityModes = {
-    "open": 0,
-    "wep": 1,
-    "wpa-psk": 2,
-    "wpa2-psk": 3,
-    "wpa/wpa2-psk": 4,
+# Security mode names, indexed by the value the WLAN interface expects
+# The network.security config key may be either the name or the value
+_SECURITY = ("open", "wep", "wpa-psk", "wpa2-psk", "wpa/wpa2-psk")
+
+
+# Defaults for each network config key
+_DEFAULTS = {
+    "mode": "ap",
+    "ssid": "pod_controller",
+    "password": "",
+    "security": "open",
+    "hostname": "pod_controller",
+    "retry_interval": 5,
+    "timeout": 10,
+    "max_failures": 5,
+    "backoff_interval": 300,
+    "max_retry_interval": 30,
+    "retry_jitter": 0.5,
 }
+_CFG = None
+
+
+def _get_config() -> dict:
+    """
+    Resolve the network config section against _DEFAULTS.
+    The section lookup is deferred until the first WifiDriver is created, then cached.
+
+    :return: A dictionary of every key in _DEFAULTS.
+    """
+    global _CFG
+    if _CFG is None:
+        network_config = Config().get.network
+        _CFG = {k: getattr(network_config, k, v) for k, v in _DEFAULTS.items()}
+    return _CFG
 
 
 class WifiDriver:
-    def __init__(
-        self,
-        context,
-        mode: str = (Config.mode if hasattr(Config, "mode") else "ap"),
-        ssid: str = (Config.ssid if hasattr(Config, "ssid") else "pod_controller"),
-        password: str = (Config.password if hasattr(Config, "password") else ""),
-        security: str = (Config.security if hasattr(Config, "security") else "open"),
-        hostname: str = (
-            Config.hostname if hasattr(Config, "hostname") else "pod_controller"
-        ),
-        retry_interval: int = (
-            Config.retry_interval if hasattr(Config, "retry_interval") else 5
-        ),
-        timeout: int = (Config.timeout if hasattr(Config, "timeout") else 10),
-        max_failures: int = (
-            Config.max_failures if hasattr(Config, "max_failures") else 5
-        ),
-        backoff_interval: int = (
-            Config.backoff_interval if hasattr(Config, "backoff_interval") else 300
-        ),
-    ):
+    """
+    Driver for the WLAN interface.
+
+    Settings default to the network config (see _DEFAULTS for the keys) and can be overridden by keyword:
+    mode, ssid, password, security, hostname, retry_interval, timeout, max_failures, backoff_interval,
+    max_retry_interval, retry_jitter.
+    """
+
+    def __init__(self, context, **overrides):
+        import network  # type: ignore (assume imports are available in micropython)
+
         Logger.debug("Initializing WLAN driver")
 
         self._context = context
 
+        # Reject misspelled or unknown overrides rather than silently ignoring them
+        unknown = [k for k in overrides if k not in _DEFAULTS]
+        if unknown:
+            raise TypeError("Unknown WifiDriver settings: " + ", ".join(unknown))
+
+        cfg = dict(_get_config())
+        cfg.update(overrides)
+
         # Initialize private variables
-        self._mode = mode
+        self._mode = cfg["mode"]
         self._was_connected = False
-        self._ssid = ssid
-        self._password = password
-        self._security = SecurityModes[security]
-        self._hostname = hostname
-        self._retry_interval = retry_interval
-        self._timeout = timeout
-        self._max_failures = max_failures
-        self._backoff_interval = backoff_interval
+        self._ssid = cfg["ssid"]
+        self._password = cfg["password"]
+        # Accept the numeric mode directly so configs that store it skip the name lookup
+        security = cfg["security"]
+        self._security = (
+            security if isinstance(security, int) else _SECURITY.index(security)
+        )
+        self._hostname = cfg["hostname"]
+        self._retry_interval = cfg["retry_interval"]
+        self._timeout = cfg["timeout"]
+        self._max_failures = cfg["max_failures"]
+        self._backoff_interval = cfg["backoff_interval"]
+        self._max_retry_interval = cfg["max_retry_interval"]
+        self._retry_jitter = cfg["retry_jitter"]
 
         self._status_code = 0
 
+        # Set once the first connection attempt has finished (connected or retries exhausted)
+        self.ready_event = asyncio.Event()
+
         # Register events in the runtime
         # self._context.eventstore.create_event("wifi_connected_event")
         # self._context.eventstore.create_event("wifi_connected_init_event")
@@ -64,9 +97,12 @@ class WifiDriver:
             (network.STA_IF if self._mode == "sta" else network.AP_IF)
         )
 
+        # Last 4 of the mac, used to make the default ssid and hostname unique
+        mac_suffix = self._interface.config("mac").hex(":")[-5:]
+
         # Add the last 4 of the mac to the ssid if in AP mode and default ssid is used
         if self._mode == "ap" and self._ssid == "pod_controller":
-            self._ssid += "_" + self._interface.config("mac").hex(":")[-5:]
+            self._ssid += "_" + mac_suffix
 
         # Configure the AP interface (if in AP mode)
         if self._mode == "ap":
@@ -78,10 +114,10 @@ class WifiDriver:
 
         # Set hostname to the provided hostname or add the last 4 of the mac to the default hostname
         if self._hostname == "pod_controller":
-            self._hostname += "_" + self._interface.config("mac").hex(":")[-5:]
+            self._hostname += "_" + mac_suffix
         network.hostname(self._hostname)
 
-        Logger.debug("WLAN hostname: " + self._hostname)
+        Logger.debug("WLAN hostname: %s", self._hostname)
 
         # Activate the interface
         self._interface.active(True)
@@ -127,6 +163,7 @@ class WifiDriver:
         """
         self._watchdog.cancel()
 
+    @micropython.native
     async def _wifi_watchdog(self) -> None:
         """
         Run the wifi watchdog. Only called on a station interface.
@@ -134,18 +171,27 @@ class WifiDriver:
         while True:
             if not self._interface.isconnected():
                 if self._was_connected:
-                    Logger.info("Disconnected from network " + self._ssid)
+                    Logger.info("Disconnected from network %s", self._ssid)
                 await self.connect()
 
             # Edge case: a soft reboot may maintain the WLAN connection but will reset _was_connected and the status code
             if self._interface.isconnected() and not self._was_connected:
                 Logger.info("Soft reset detected, network is still connected")
-                Logger.info("Network details: " + str(self._interface.ifconfig()))
+                Logger.info("Network details: %s", self._interface.ifconfig())
                 self._was_connected = True
                 self._status_code = 1
+                self.ready_event.set()
 
-            # Yield to other tasks
-            await asyncio.sleep_ms(100)
+            # The WLAN interface has no disconnect callback, so check the link at a coarse interval
+            await asyncio.sleep_ms(1000)
+
+    async def _wait_connected(self) -> None:
+        """
+        Wait until the interface reports a connection.
+        Association rarely completes in under 200 ms, so there is no point checking more often.
+        """
+        while not self._interface.isconnected():
+            await asyncio.sleep_ms(200)
 
     async def _do_connect(self) -> None:
         """
@@ -155,59 +201,65 @@ class WifiDriver:
         sta_if = self._interface
 
         # Log that we are connecting
-        Logger.info("Connecting to network " + self._ssid + "...")
+        Logger.info("Connecting to network %s...", self._ssid)
 
-        # Store time ticks in ms for timeout, attempt to connect, and wait for connection
-        start = time.ticks_ms()
+        # Attempt to connect and wait for the connection, up to _timeout seconds
         sta_if.connect(self._ssid, self._password)
 
-        while not sta_if.isconnected() and time.ticks_diff(time.ticks_ms(), start) < (
-            self._timeout * 1000
-        ):
-            await asyncio.sleep_ms(100)
-
-        if time.ticks_diff(time.ticks_ms(), start) >= (self._timeout * 1000):
+        try:
+            await asyncio.wait_for(self._wait_connected(), self._timeout)
+        except asyncio.TimeoutError:
             raise Exception("Connection timed out")
 
         # Log success and the network details
-        Logger.info("Connected to network " + self._ssid)
-        Logger.info("Network details: " + str(sta_if.ifconfig()))
+        Logger.info("Connected to network %s", self._ssid)
+        Logger.info("Network details: %s", sta_if.ifconfig())
 
         self._was_connected = True
         self._status_code = 1
+        self.ready_event.set()
+
+    @micropython.native
+    def _retry_delay(self, failures: int) -> float:
+        """
+        Get the delay before the next connection attempt.
+        Doubles retry_interval per failure up to max_retry_interval, then applies +/- retry_jitter.
+
+        :param failures: The number of failed attempts so far.
+        :return: The delay in seconds.
+        """
+        delay = min(self._retry_interval * (1 << failures), self._max_retry_interval)
+        return delay * (1 + self._retry_jitter * (random.getrandbits(8) / 128 - 1))
 
     async def connect(self, failures: int = 0) -> bool:
         """
-        Connect to wifi unless max_failures has been reached.
+        Connect to wifi, retrying until max_failures has been reached.
 
+        :param failures: The number of failures already counted against max_failures.
         :return: True if connected, False otherwise.
         """
 
-        # Try establishing connection, or log the error and wait _retry_interval seconds
-        try:
-            await self._do_connect()
-            return True
-
-        except Exception as e:
-            # If max_failures has not been reached, log the error and wait _retry_interval seconds
-            if failures < self._max_failures:
-                Logger.error(
-                    "Failed to connect to network " + self._ssid + "(" + str(e) + ")"
-                )
-                Logger.info("Retrying in " + str(self._retry_interval) + " seconds...")
-                await asyncio.sleep(self._retry_interval)
-                await self.connect(failures=failures + 1)
-            else:
-                # If max_failures has been reached, log the error, wait _backoff_interval seconds, and return False
-                # This will cause the self.run() function to try again
-                Logger.error(
-                    "Failed to connect to network " + self._ssid + "(" + str(e) + ")"
-                )
-                Logger.info(
-                    "Retry limit reached, restarting in "
-                    + str(self._backoff_interval)
-                    + " seconds..."
-                )
-                self._status_code = 2
-                await asyncio.sleep(self._backoff_interval)
-                return False
+        # The initial connection attempt plus up to max_failures retries
+        for failures in range(failures, self._max_failures + 1):
+            try:
+                await self._do_connect()
+                return True
+
+            except Exception as e:
+                Logger.error("Failed to connect to network %s (%s)", self._ssid, e)
+
+                # Wait with exponential backoff and jitter unless this was the last attempt
+                if failures < self._max_failures:
+                    delay = self._retry_delay(failures)
+                    Logger.info("Retrying in %.1f seconds...", delay)
+                    await asyncio.sleep(delay)
+
+        # If max_failures has been reached, wait _backoff_interval seconds and return False
+        # This will cause the watchdog to try again
+        Logger.info(
+            "Retry limit reached, restarting in %s seconds...", self._backoff_interval
+        )
+        self._status_code = 2
+        self.ready_event.set()
+        await asyncio.sleep(self._backoff_interval)
+        return False
@@ -1,6 +1,8 @@
 class BaseDriver:
     def __init__(self, context: object = None):
         self._context = context  # This is the app or module that owns the driver
+        self._wrapped_cache = {}  # funcname -> wrapped function
+        self._name = type(self).__name__
 
     @property
     def context(self) -> object:
@@ -9,7 +11,7 @@ class BaseDriver:
     # Set __name__ to the class name of this driver
     @property
     def __name__(self) -> str:
-        return self.__class__.__name__
+        return self._name
 
     def get_wrapped_function(self, funcname: str) -> callable:
         """
@@ -19,6 +21,9 @@ class BaseDriver:
         :param funcname: The name of the function to wrap.
         :return: The wrapped function.
         """
-        wrapped_self = getattr(self._context, self.__name__)
-        wrapped_func = getattr(wrapped_self, funcname)
+        wrapped_func = self._wrapped_cache.get(funcname)
+        if wrapped_func is None:
+            wrapped_self = getattr(self._context, self._name)
+            wrapped_func = getattr(wrapped_self, funcname)
+            self._wrapped_cache[funcname] = wrapped_func
         return wrapped_func
@@ -2,7 +2,8 @@
 Float pod external light / audio controller firmware
 """
 
-import asyncio, machine
+import asyncio, machine, micropython  # type: ignore (assume imports are available in micropython)
+from micropython import const  # type: ignore (assume imports are available in micropython)
 
 from components.App import BaseApp
 from drivers.Logger import Logger
@@ -10,13 +11,29 @@ from drivers.Logger import Logger
 Logger = Logger(module_name="main")
 GLOBAL_DEBUG = False
 
+# Longpress mask bits for each external button
+_LIGHT_BIT = const(1)
+_AUDIO_BIT = const(2)
+_BOTH_BITS = const(3)
+
+
+def set_global_exception(app: BaseApp, run_task):
+    """
+    Install an exception handler on the running loop that prints the exception and stops the app.
+    Must be called from inside the running loop so it is installed on that loop.
+
+    :param app: The app to stop.
+    :param run_task: The task running the app, cancelled so setup() cannot hang on a ready event.
+    """
 
-def set_global_exception():
     def handle_exception(loop, context):
         import sys
 
         sys.print_exception(context["exception"])
-        sys.exit()
+
+        # Let asyncio.run return instead of exiting from inside the handler
+        app.stop()
+        run_task.cancel()
 
     loop = asyncio.get_event_loop()
     loop.set_exception_handler(handle_exception)
@@ -27,9 +44,10 @@ class FloatPodController(BaseApp):
         kwargs["app_name"] = "FloatPodController"
 
         self._status_code = 0
+        self.status_changed = asyncio.Event()
 
-        self._light_longpress = False
-        self._audio_longpress = False
+        self._longpress_mask = 0
+        self._both_longpress_evt = asyncio.Event()
 
         self.Logger = Logger
 
@@ -46,29 +64,32 @@ class FloatPodController(BaseApp):
     @status_code.setter
     def status_code(self, status_code: int):
         """
-        Set the current status code.
+        Set the current status code and notify waiters of status_changed.
         """
         self._status_code = status_code
+        self.status_changed.set()
 
-    def _longpress_flag(self, button, state):
+    @micropython.native
+    def _longpress_flag(self, bit, state):
         """
-        Set the longpress flag for a button.
+        Set or clear the longpress bit for a button.
         """
-        flag = getattr(self, "_" + button + "_longpress")
+        mask = (self._longpress_mask | bit) if state else (self._longpress_mask & ~bit)
+
+        if mask != self._longpress_mask:
+            Logger.debug("Setting longpress mask to %d", mask)
+            self._longpress_mask = mask
 
-        if flag != state:
-            Logger.debug(f"Setting {button} longpress flag to {state}")
-            setattr(self, "_" + button + "_longpress", state)
+            if mask == _BOTH_BITS:
+                self._both_longpress_evt.set()
 
     async def _longpress_watchdog(self):
         """
         Watchdog for longpresses.
         """
-        while True:
-            if self._light_longpress and self._audio_longpress:
-                self.Logger.info("Longpress detected on both buttons, resetting")
-                machine.reset()
-            await asyncio.sleep_ms(100)
+        await self._both_longpress_evt.wait()
+        self.Logger.info("Longpress detected on both buttons, resetting")
+        machine.reset()
 
     async def setup(self):
         """
@@ -125,28 +146,29 @@ class FloatPodController(BaseApp):
         self.PodLightSwitch = Switch(self.POD_LIGHT_CTRL_NO)
         self.PodAudioSwitch = Switch(self.POD_AUDIO_CTRL_NO)
 
-        # Setup the open_func and close_func for the pod light and audio controls to toggle the light and audio relays
-        self.PodLightSwitch.open_func(self.LightRelay.toggle)
-        self.PodLightSwitch.close_func(self.LightRelay.toggle)
-        self.PodAudioSwitch.open_func(self.AudioRelays.toggle)
-        self.PodAudioSwitch.close_func(self.AudioRelays.toggle)
-
         # Create pushbutton objects for the external light and audio controls
         self.ExtLightButton = Pushbutton(self.EXT_LIGHT_CTRL)
         self.ExtAudioButton = Pushbutton(self.EXT_AUDIO_CTRL)
 
-        # Setup press_func for the external light and audio controls to toggle the light and audio relays
-        self.ExtLightButton.press_func(self.LightRelay.toggle)
-        self.ExtAudioButton.press_func(self.AudioRelays.toggle)
-
-        # Setup longpress_func for the external light and audio controls
-        # The longpress_func should set a flag to enable functionality of longpressing both buttons at the same time to soft reset the program
-        self.ExtLightButton.long_func(self._longpress_flag, ["light", True])
-        self.ExtAudioButton.long_func(self._longpress_flag, ["audio", True])
-
-        # Set release_func for the external light and audio controls to clear the longpress flag
-        self.ExtLightButton.release_func(self._longpress_flag, ["light", False])
-        self.ExtAudioButton.release_func(self._longpress_flag, ["audio", False])
+        # Wire the controls to their handlers as (control, callback setter, handler, args):
+        # - open_func/close_func on the pod switches and press_func on the external buttons toggle the relays
+        # - long_func sets a mask bit to enable longpressing both buttons at the same time to soft reset the program
+        # - release_func clears the longpress bit
+        flag = self._longpress_flag
+        bindings = (
+            (self.PodLightSwitch, "open_func", self.LightRelay.toggle, ()),
+            (self.PodLightSwitch, "close_func", self.LightRelay.toggle, ()),
+            (self.PodAudioSwitch, "open_func", self.AudioRelays.toggle, ()),
+            (self.PodAudioSwitch, "close_func", self.AudioRelays.toggle, ()),
+            (self.ExtLightButton, "press_func", self.LightRelay.toggle, ()),
+            (self.ExtAudioButton, "press_func", self.AudioRelays.toggle, ()),
+            (self.ExtLightButton, "long_func", flag, [_LIGHT_BIT, True]),
+            (self.ExtAudioButton, "long_func", flag, [_AUDIO_BIT, True]),
+            (self.ExtLightButton, "release_func", flag, [_LIGHT_BIT, False]),
+            (self.ExtAudioButton, "release_func", flag, [_AUDIO_BIT, False]),
+        )
+        for control, setter, handler, args in bindings:
+            getattr(control, setter)(handler, args)
 
         # Set the initial state of the light and audio relays based on the state of the pod light and audio controls
         # Note that a state of 0 means the switch is "on" and a state of 1 means the switch is "off"
@@ -158,8 +180,7 @@ class FloatPodController(BaseApp):
 
         # Loop until wifi is connected or the timeout is reached
         self.Logger.info("Waiting for wifi connection to continue setup")
-        while self.Wifi.status_code not in [1, 2]:
-            await asyncio.sleep_ms(100)
+        await self.Wifi.ready_event.wait()
 
         # Initialize NTPTime sync
         from drivers.NTPTime import NTPTime
@@ -167,18 +188,27 @@ class FloatPodController(BaseApp):
         self.NTPTime = NTPTime(self)
 
         self.Logger.info("Waiting for NTP sync to continue setup")
-        while self.NTPTime.status_code not in [1, 2]:
-            await asyncio.sleep_ms(100)
+        await self.NTPTime.ready_event.wait()
 
         Logger.info("Application setup complete")
         self.status_code = 2
 
     async def run(self):
-        # Set up the app
-        await self.setup()
+        # Install the exception handler on the running loop
+        set_global_exception(self, asyncio.current_task())
+
+        try:
+            # Set up the app
+            await self.setup()
+
+            # Run the main loop
+            await super()._loop()
 
-        # Run the main loop
-        await super()._loop()
+        # Cancelled by the exception handler after a task failed (it stops the app first)
+        except asyncio.CancelledError:
+            if not self._shutdown.is_set():
+                raise
+            Logger.critical("Unhandled exception in a task, stopping")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,16 @@
+# Freeze the app's packages into the firmware image so they are loaded from flash instead of
+# being compiled on the heap at import, e.g. for the ESP32 port:
+#   make BOARD=ESP32_GENERIC FROZEN_MANIFEST=/path/to/float-controller/manifest.py
+#
+# After flashing the frozen build, delete components/, drivers/ and utilities.py from the device
+# filesystem (e.g. `mpremote rm -r :components :drivers` and `mpremote rm :utilities.py`) and stop
+# uploading them. The default sys.path searches '' before '.frozen', so filesystem copies win and
+# the frozen modules would be silently unused.
+#
+# boot.py, main.py and config.json stay on the filesystem: MicroPython runs boot.py and main.py
+# from there at startup and the config is read from /config.json.
+include("$(PORT_DIR)/boards/manifest.py")
+
+package("components")
+package("drivers")
+module("utilities.py")